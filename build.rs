@@ -3,9 +3,27 @@
 
 use anyhow::Result;
 
+// Hard link the hook into place so that the script does not have to be copied
+// on every build. Fall back to copying if a link cannot be created.
+fn install_hook(name: &str) -> Result<()> {
+    let src = format!("./scripts/{name}");
+    let dst = format!("./.git/hooks/{name}");
+
+    // Rerun the build script only when the hook changes rather than after
+    // every change to the package.
+    println!("cargo:rerun-if-changed={src}");
+
+    // Remove any existing hook so that it can be replaced by the link.
+    let _ = std::fs::remove_file(&dst);
+    if std::fs::hard_link(&src, &dst).is_err() {
+        std::fs::copy(&src, &dst)?;
+    }
+    Ok(())
+}
+
 fn main() -> Result<()> {
-    // Copy hooks to appropriate location so that git will run them.
-    std::fs::copy("./scripts/pre-commit", "./.git/hooks/pre-commit")?;
-    std::fs::copy("./scripts/pre-push", "./.git/hooks/pre-push")?;
+    // Install hooks to appropriate location so that git will run them.
+    install_hook("pre-commit")?;
+    install_hook("pre-push")?;
     Ok(())
 }
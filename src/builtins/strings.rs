@@ -45,7 +45,7 @@ fn concat(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let delimiter = ensure_string(name, &params[0], &args[0])?;
     let collection = ensure_string_collection(name, &params[1], &args[1])?;
-    Ok(Value::String(collection.join(&delimiter)))
+    Ok(Value::String(collection.join(delimiter)))
 }
 
 fn contains(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
@@ -53,7 +53,7 @@ fn contains(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let s1 = ensure_string(name, &params[0], &args[0])?;
     let s2 = ensure_string(name, &params[1], &args[1])?;
-    Ok(Value::Bool(s1.contains(&s2)))
+    Ok(Value::Bool(s1.contains(s2)))
 }
 
 fn endswith(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
@@ -61,7 +61,7 @@ fn endswith(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let s1 = ensure_string(name, &params[0], &args[0])?;
     let s2 = ensure_string(name, &params[1], &args[1])?;
-    Ok(Value::Bool(s1.ends_with(&s2)))
+    Ok(Value::Bool(s1.ends_with(s2)))
 }
 
 fn format_int(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
@@ -92,7 +92,7 @@ fn indexof(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let s1 = ensure_string(name, &params[0], &args[0])?;
     let s2 = ensure_string(name, &params[1], &args[1])?;
-    Ok(Value::from_float(match s1.find(&s2) {
+    Ok(Value::from_float(match s1.find(s2) {
         Some(pos) => pos as i64,
         _ => -1,
     } as Float))
@@ -107,7 +107,7 @@ fn indexof_n(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     let mut positions = vec![];
     let mut idx = 0;
     while idx < s1.len() {
-        if let Some(pos) = s1.find(&s2) {
+        if let Some(pos) = s1.find(s2) {
             positions.push(Value::from_float(pos as Float));
             idx = pos + 1;
         } else {
@@ -130,7 +130,7 @@ fn replace(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     let s = ensure_string(name, &params[0], &args[0])?;
     let old = ensure_string(name, &params[1], &args[1])?;
     let new = ensure_string(name, &params[2], &args[2])?;
-    Ok(Value::String(s.replace(&old, &new)))
+    Ok(Value::String(s.replace(old, new)))
 }
 
 fn split(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
@@ -140,7 +140,7 @@ fn split(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     let delimiter = ensure_string(name, &params[1], &args[1])?;
 
     Ok(Value::from_array(
-        s.split(&delimiter)
+        s.split(delimiter)
             .map(|s| Value::String(s.to_string()))
             .collect(),
     ))
@@ -380,14 +380,14 @@ fn startswith(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let s1 = ensure_string(name, &params[0], &args[0])?;
     let s2 = ensure_string(name, &params[1], &args[1])?;
-    Ok(Value::Bool(s1.starts_with(&s2)))
+    Ok(Value::Bool(s1.starts_with(s2)))
 }
 
 fn replace_n(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     let name = "trim";
     ensure_args_count(span, name, params, args, 2)?;
     let obj = ensure_object(name, &params[0], args[0].clone())?;
-    let mut s = ensure_string(name, &params[1], &args[1])?;
+    let mut s = ensure_string(name, &params[1], &args[1])?.to_string();
 
     let span = params[0].span();
     for item in obj.as_ref().iter() {
@@ -466,9 +466,9 @@ fn trim_prefix(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let s1 = ensure_string(name, &params[0], &args[0])?;
     let s2 = ensure_string(name, &params[1], &args[1])?;
-    Ok(Value::String(match s1.strip_prefix(&s2) {
+    Ok(Value::String(match s1.strip_prefix(s2) {
         Some(s) => s.to_string(),
-        _ => s1,
+        _ => s1.to_string(),
     }))
 }
 
@@ -494,9 +494,9 @@ fn trim_suffix(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     ensure_args_count(span, name, params, args, 2)?;
     let s1 = ensure_string(name, &params[0], &args[0])?;
     let s2 = ensure_string(name, &params[1], &args[1])?;
-    Ok(Value::String(match s1.strip_suffix(&s2) {
+    Ok(Value::String(match s1.strip_suffix(s2) {
         Some(s) => s.to_string(),
-        _ => s1,
+        _ => s1.to_string(),
     }))
 }
 
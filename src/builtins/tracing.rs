@@ -26,5 +26,5 @@ fn trace(span: &Span, params: &[Expr], args: &[Value]) -> Result<Value> {
     // The interpreter accumulates the traces.
     // TODO: Stateful bultins can pass in a state that would allow capturing
     // the traces in the state.
-    Ok(Value::String(msg))
+    Ok(Value::String(msg.to_string()))
 }
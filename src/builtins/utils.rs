@@ -43,9 +43,9 @@ pub fn ensure_numeric(fcn: &str, arg: &Expr, v: &Value) -> Result<Float> {
     })
 }
 
-pub fn ensure_string(fcn: &str, arg: &Expr, v: &Value) -> Result<String> {
+pub fn ensure_string<'a>(fcn: &str, arg: &Expr, v: &'a Value) -> Result<&'a str> {
     Ok(match &v {
-        Value::String(s) => s.clone(),
+        Value::String(s) => s.as_str(),
         _ => {
             let span = arg.span();
             bail!(span.error(format!("`{fcn}` expects string argument. Got `{v}` instead").as_str()))
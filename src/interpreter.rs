@@ -14,6 +14,7 @@ use std::rc::Rc;
 
 type Scope = BTreeMap<String, Value>;
 
+#[derive(Clone)]
 pub struct Interpreter<'source> {
     modules: Vec<&'source Module<'source>>,
     module: Option<&'source Module<'source>>,
@@ -27,10 +28,12 @@ pub struct Interpreter<'source> {
     functions: HashMap<String, &'source Rule<'source>>,
     rules: HashMap<String, Vec<&'source Rule<'source>>>,
     default_rules: HashMap<String, Vec<(&'source Rule<'source>, Option<String>)>>,
+    rule_modules: BTreeMap<&'source Rule<'source>, &'source Module<'source>>,
     processed: BTreeSet<&'source Rule<'source>>,
     active_rules: Vec<&'source Rule<'source>>,
-    builtins_cache: BTreeMap<(&'static str, Vec<Value>), Value>,
+    builtins_cache: BTreeMap<&'static str, BTreeMap<Vec<Value>, Value>>,
     no_rules_lookup: bool,
+    rules_gathered: bool,
     traces: Option<Vec<String>>,
 }
 
@@ -63,10 +66,12 @@ impl<'source> Interpreter<'source> {
             functions: HashMap::new(),
             rules: HashMap::new(),
             default_rules: HashMap::new(),
+            rule_modules: BTreeMap::new(),
             processed: BTreeSet::new(),
             active_rules: vec![],
             builtins_cache: BTreeMap::new(),
             no_rules_lookup: false,
+            rules_gathered: false,
             traces: None,
         })
     }
@@ -1167,17 +1172,12 @@ impl<'source> Interpreter<'source> {
         }
     }
 
-    fn lookup_function(&self, fcn: &'source Expr<'source>) -> Result<&'source Rule<'source>> {
-        let mut path = Self::get_path_string(fcn, None)?;
-        if !path.starts_with("data.") {
-            path = self.current_module_path.clone() + "." + &path;
-        }
-
-        match self.functions.get(&path) {
-            Some(r) => Ok(r),
-            _ => {
-                bail!("function not found")
-            }
+    fn lookup_function(&self, path: &str) -> Option<&'source Rule<'source>> {
+        if path.starts_with("data.") {
+            self.functions.get(path).copied()
+        } else {
+            let path = self.current_module_path.clone() + "." + path;
+            self.functions.get(&path).copied()
         }
     }
 
@@ -1199,8 +1199,10 @@ impl<'source> Interpreter<'source> {
         }
 
         let cache = builtins::must_cache(name.as_str());
-        if let Some(name) = &cache {
-            if let Some(v) = self.builtins_cache.get(&(name, args.clone())) {
+        if let Some(name) = cache {
+            // Cached values are keyed per builtin so that the arguments need
+            // not be cloned just to perform the lookup.
+            if let Some(v) = self.builtins_cache.get(name).and_then(|c| c.get(&args)) {
                 return Ok(v.clone());
             }
         }
@@ -1215,7 +1217,10 @@ impl<'source> Interpreter<'source> {
         };
 
         if let Some(name) = cache {
-            self.builtins_cache.insert((name, args), v.clone());
+            self.builtins_cache
+                .entry(name)
+                .or_default()
+                .insert(args, v.clone());
         }
         Ok(v)
     }
@@ -1226,15 +1231,24 @@ impl<'source> Interpreter<'source> {
         fcn: &'source Expr<'source>,
         params: &'source Vec<Expr<'source>>,
     ) -> Result<Value> {
-        let fcn_rule = match self.lookup_function(fcn) {
-            Ok(r) => r,
+        // Compute the function path once and use it to look up both
+        // user defined functions and builtins.
+        let path = match Self::get_path_string(fcn, None) {
+            Ok(path) => path,
+            _ => {
+                return Err(span
+                    .source
+                    .error(span.line, span.col, "could not find function"))
+            }
+        };
+
+        let fcn_rule = match self.lookup_function(&path) {
+            Some(r) => r,
             _ => {
                 // Look up builtin function.
                 // TODO: handle with modifier
-                if let Ok(path) = Self::get_path_string(fcn, None) {
-                    if let Some(builtin) = builtins::BUILTINS.get(path.as_str()) {
-                        return self.eval_builtin_call(span, path, *builtin, params);
-                    }
+                if let Some(builtin) = builtins::BUILTINS.get(path.as_str()) {
+                    return self.eval_builtin_call(span, path, *builtin, params);
                 }
 
                 return Err(span
@@ -1362,26 +1376,28 @@ impl<'source> Interpreter<'source> {
         // Ensure that rules are evaluated
         if name == "data" {
             // Evaluate rule corresponding to longest matching path.
+            // Build the full path once and drop trailing fields from it
+            // instead of joining a new path for each prefix.
+            let mut path = "data.".to_owned() + &fields.join(".");
             for i in (1..fields.len() + 1).rev() {
-                let path = "data.".to_owned() + &fields[0..i].join(".");
                 if self.rules.get(&path).is_some() || self.default_rules.get(&path).is_some() {
                     self.ensure_rule_evaluated(path)?;
                     break;
                 }
+                path.truncate(path.len() - fields[i - 1].len() - 1);
             }
             Ok(Self::get_value_chained(self.data.clone(), fields))
         } else {
             // Add module prefix and ensure that any matching rule is evaluated.
-            let module_path =
-                Self::get_path_string(&self.current_module()?.package.refr, Some("data"))?;
-            let path = module_path + "." + name;
+            // The module's data path is cached by set_current_module.
+            let module = self.current_module()?;
+            let path = self.current_module_path.clone() + "." + name;
             self.ensure_rule_evaluated(path)?;
 
-            let mut path: Vec<&str> =
-                Parser::get_path_ref_components(&self.module.unwrap().package.refr)?
-                    .iter()
-                    .map(|s| s.text())
-                    .collect();
+            let mut path: Vec<&str> = Parser::get_path_ref_components(&module.package.refr)?
+                .iter()
+                .map(|s| s.text())
+                .collect();
             path.push(name);
 
             let value = Self::get_value_chained(self.data.clone(), &path[..]);
@@ -1394,8 +1410,10 @@ impl<'source> Interpreter<'source> {
             Expr::Null(_) => Ok(Value::Null),
             Expr::True(_) => Ok(Value::Bool(true)),
             Expr::False(_) => Ok(Value::Bool(false)),
-            Expr::Number(span) => match serde_json::from_str::<Value>(span.text()) {
-                Ok(v) => Ok(v),
+            // Parse directly into a float rather than through Value's untagged
+            // deserializer, which buffers the input and tries each variant.
+            Expr::Number(span) => match serde_json::from_str::<Float>(span.text()) {
+                Ok(v) => Ok(Value::from_float(v)),
                 Err(e) => Err(span.source.error(
                     span.line,
                     span.col,
@@ -1486,12 +1504,10 @@ impl<'source> Interpreter<'source> {
     }
 
     fn get_rule_module(&self, rule: &'source Rule<'source>) -> Result<&'source Module<'source>> {
-        for m in &self.modules {
-            if m.policy.contains(rule) {
-                return Ok(m);
-            }
+        match self.rule_modules.get(rule) {
+            Some(m) => Ok(*m),
+            _ => bail!("internal error: could not find module for rule"),
         }
-        bail!("internal error: could not find module for rule");
     }
 
     fn eval_rule_bodies(
@@ -1664,8 +1680,7 @@ impl<'source> Interpreter<'source> {
     pub fn update_function_table(&mut self) -> Result<()> {
         for module in self.modules.clone() {
             let prev_module = self.set_current_module(Some(module))?;
-            let module_path =
-                Self::get_path_string(&self.current_module()?.package.refr, Some("data"))?;
+            let module_path = self.current_module_path.clone();
             for rule in &module.policy {
                 if let Rule::Spec {
                     head: RuleHead::Func { refr, .. },
@@ -1906,6 +1921,13 @@ impl<'source> Interpreter<'source> {
 
         self.builtins_cache.clear();
 
+        // Discard the results of any previous evaluation so that the same
+        // interpreter can be used to evaluate the modules again.
+        self.processed.clear();
+        self.loop_var_values.clear();
+        self.input = Value::new_object();
+        self.data = Value::new_object();
+
         if let Some(input) = input {
             self.input = input.clone();
 
@@ -1924,9 +1946,14 @@ impl<'source> Interpreter<'source> {
             }
         }
 
-        self.check_default_rules()?;
+        // Default rules and rule tables depend only on the modules. Check and
+        // gather them during the first evaluation and reuse them afterwards.
+        if !self.rules_gathered {
+            self.check_default_rules()?;
+            self.gather_rules()?;
+            self.rules_gathered = true;
+        }
         self.update_function_table()?;
-        self.gather_rules()?;
 
         for module in self.modules.clone() {
             for rule in &module.policy {
@@ -1983,9 +2010,14 @@ impl<'source> Interpreter<'source> {
     }
 
     fn gather_rules(&mut self) -> Result<()> {
+        self.rules.clear();
+        self.default_rules.clear();
+        self.rule_modules.clear();
         for module in self.modules.clone() {
             let prev_module = self.set_current_module(Some(module))?;
             for rule in &module.policy {
+                // Record the owning module so that it need not be searched for.
+                self.rule_modules.insert(rule, module);
                 let refr = Self::get_rule_refr(rule);
                 if let Rule::Spec { .. } = rule {
                     // Adjust refr to ensure simple ref.
@@ -1,11 +1,12 @@
 // Copyright (c) Microsoft Corporation.
 // Licensed under the MIT License.
 
+use core::cmp::Ordering;
 use core::fmt::{Debug, Formatter};
 use core::iter::Peekable;
 use core::str::CharIndices;
 
-use crate::value::Value;
+use crate::value::Float;
 use anyhow::{anyhow, bail, Result};
 
 #[derive(PartialEq, Eq, PartialOrd, Ord, Clone)]
@@ -48,7 +49,7 @@ impl<'source> Source<'source> {
     }
 }
 
-#[derive(PartialEq, Eq, PartialOrd, Ord, Clone)]
+#[derive(Clone)]
 pub struct Span<'source> {
     pub source: &'source Source<'source>,
     pub line: u16,
@@ -57,6 +58,34 @@ pub struct Span<'source> {
     pub end: u16,
 }
 
+// Spans are compared using the identity of their source and their position
+// within it. Deriving the comparisons would compare the entire contents of the
+// source each time two spans (and hence ast nodes) are compared.
+impl<'source> Ord for Span<'source> {
+    fn cmp(&self, other: &Self) -> Ordering {
+        (self.source as *const Source)
+            .cmp(&(other.source as *const Source))
+            .then(self.line.cmp(&other.line))
+            .then(self.col.cmp(&other.col))
+            .then(self.start.cmp(&other.start))
+            .then(self.end.cmp(&other.end))
+    }
+}
+
+impl<'source> PartialOrd for Span<'source> {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl<'source> PartialEq for Span<'source> {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl<'source> Eq for Span<'source> {}
+
 impl<'source> Span<'source> {
     pub fn text(&self) -> &'source str {
         &self.source.contents[self.start as usize..self.end as usize]
@@ -206,7 +235,9 @@ impl<'source> Lexer<'source> {
         }
 
         // Ensure that the number is parsable in Rust.
-        match serde_json::from_str::<'source, Value>(&self.source.contents[start..end]) {
+        // Parse into a float directly; going through Value's untagged
+        // deserializer would buffer the token and try each variant first.
+        match serde_json::from_str::<'source, Float>(&self.source.contents[start..end]) {
             Ok(_) => (),
             Err(e) => {
                 let serde_msg = &e.to_string();
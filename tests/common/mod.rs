@@ -0,0 +1,26 @@
+// Copyright (c) Microsoft Corporation.
+// Licensed under the MIT License.
+
+#![cfg(test)]
+
+// Helpers shared by the lexer, parser and interpreter test drivers.
+
+use anyhow::Result;
+use std::env;
+
+// Run given yaml test implementation against file.
+pub fn check_yaml_test(file: &str, yaml_test_impl: fn(&str) -> Result<()>) -> Result<()> {
+    match yaml_test_impl(file) {
+        Ok(_) => Ok(()),
+        Err(e) => {
+            // If Err is returned, it doesn't always get printed by cargo test.
+            // Therefore, panic with the error.
+            panic!("{}", e);
+        }
+    }
+}
+
+// Return the first command-line argument that has the given extension.
+pub fn file_arg(ext: &str) -> Option<String> {
+    env::args().find(|a| a.ends_with(ext))
+}
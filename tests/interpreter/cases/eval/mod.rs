@@ -0,0 +1,66 @@
+// Copyright (c) Microsoft Corporation.
+// Licensed under the MIT License.
+
+#![cfg(test)]
+
+use crate::interpreter::*;
+
+const REGO: &str = r#"
+    package test
+
+    default allow = false
+
+    allow {
+        input.x > 1
+    }
+"#;
+
+#[test]
+fn reuse_interpreter() -> Result<()> {
+    let source = Source {
+        file: "test.rego",
+        contents: REGO,
+        lines: REGO.split('\n').collect(),
+    };
+    let mut parser = Parser::new(&source)?;
+    let module = parser.parse()?;
+
+    // Evaluate the same modules multiple times with different inputs.
+    let mut interpreter = Interpreter::new(vec![&module])?;
+    for (input, expected) in [
+        (r#"{ "x": 2 }"#, r#"{ "test": { "allow": true } }"#),
+        (r#"{ "x": 0 }"#, r#"{ "test": { "allow": false } }"#),
+        (r#"{ "x": 3 }"#, r#"{ "test": { "allow": true } }"#),
+    ] {
+        let input = Value::from_json_str(input)?;
+        assert_eq!(
+            interpreter.eval(&None, &Some(input), false)?,
+            Value::from_json_str(expected)?
+        );
+    }
+    Ok(())
+}
+
+#[test]
+fn clone_interpreter() -> Result<()> {
+    let source = Source {
+        file: "test.rego",
+        contents: REGO,
+        lines: REGO.split('\n').collect(),
+    };
+    let mut parser = Parser::new(&source)?;
+    let module = parser.parse()?;
+
+    // A clone of an evaluated interpreter reuses its rule tables.
+    let mut interpreter = Interpreter::new(vec![&module])?;
+    let input = Value::from_json_str(r#"{ "x": 2 }"#)?;
+    interpreter.eval(&None, &Some(input), false)?;
+
+    let mut cloned = interpreter.clone();
+    let input = Value::from_json_str(r#"{ "x": 0 }"#)?;
+    assert_eq!(
+        cloned.eval(&None, &Some(input), false)?,
+        Value::from_json_str(r#"{ "test": { "allow": false } }"#)?
+    );
+    Ok(())
+}
@@ -4,5 +4,6 @@
 mod arithmetic;
 mod builtins;
 mod compr;
+mod eval;
 mod r#in;
 mod variables;
@@ -5,6 +5,7 @@
 
 use std::env;
 
+use crate::common::{check_yaml_test, file_arg};
 use anyhow::{bail, Result};
 use regorus::*;
 use serde::{Deserialize, Serialize};
@@ -321,37 +322,16 @@ fn yaml_test_impl(file: &str) -> Result<()> {
 }
 
 fn yaml_test(file: &str) -> Result<()> {
-    match yaml_test_impl(file) {
-        Ok(_) => Ok(()),
-        Err(e) => {
-            // If Err is returned, it doesn't always get printed by cargo test.
-            // Therefore, panic with the error.
-            panic!("{}", e);
-        }
-    }
-}
-
-#[test]
-fn yaml_test_basic() -> Result<()> {
-    yaml_test("tests/interpreter/cases/basic_001.yaml")
+    check_yaml_test(file, yaml_test_impl)
 }
 
 #[test]
 #[ignore = "intended for use by scripts/yaml-test-eval"]
 fn one_yaml() -> Result<()> {
-    let mut file = String::default();
-    for a in env::args() {
-        if a.ends_with(".yaml") {
-            file = a;
-            break;
-        }
+    match file_arg(".yaml") {
+        Some(file) => yaml_test(file.as_str()),
+        None => bail!("missing <policy.rego>"),
     }
-
-    if file.is_empty() {
-        bail!("missing <policy.rego>");
-    }
-
-    yaml_test(file.as_str())
 }
 
 #[test_resources("tests/interpreter/**/*.yaml")]
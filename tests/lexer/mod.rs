@@ -3,6 +3,7 @@
 
 #![cfg(test)]
 
+use crate::common::{check_yaml_test, file_arg};
 use anyhow::{bail, Result};
 use regorus::*;
 use serde::{Deserialize, Serialize};
@@ -191,32 +192,16 @@ fn yaml_test_impl(file: &str) -> Result<()> {
 }
 
 fn yaml_test(file: &str) -> Result<()> {
-    match yaml_test_impl(file) {
-        Ok(_) => Ok(()),
-        Err(e) => {
-            // If Err is returned, it doesn't always get printed by cargo test.
-            // Therefore, panic with the error.
-            panic!("{}", e);
-        }
-    }
+    check_yaml_test(file, yaml_test_impl)
 }
 
 #[test]
 #[ignore = "intended for use by scripts/yaml-test-lex"]
 fn one_yaml() -> Result<()> {
-    let mut file = String::default();
-    for a in env::args() {
-        if a.ends_with(".yaml") {
-            file = a;
-            break;
-        }
+    match file_arg(".yaml") {
+        Some(file) => yaml_test(file.as_str()),
+        None => bail!("missing yaml test file"),
     }
-
-    if file.is_empty() {
-        bail!("missing yaml test file");
-    }
-
-    yaml_test(file.as_str())
 }
 
 /*
@@ -3,10 +3,10 @@
 
 #![cfg(test)]
 
+use crate::common::{check_yaml_test, file_arg};
 use anyhow::{anyhow, bail, Result};
 use regorus::*;
 use serde::{Deserialize, Serialize};
-use std::env;
 use test_generator::test_resources;
 //use walkdir::WalkDir;
 
@@ -26,17 +26,10 @@ macro_rules! my_assert_eq {
 #[test]
 #[ignore = "intended for use by scripts/rego-parse"]
 fn one_file() -> Result<()> {
-    let mut file = String::default();
-    for a in env::args() {
-        if a.ends_with(".rego") {
-            file = a;
-            break;
-        }
-    }
-
-    if file.is_empty() {
-        bail!("missing <policy.rego>");
-    }
+    let file = match file_arg(".rego") {
+        Some(file) => file,
+        None => bail!("missing <policy.rego>"),
+    };
 
     let contents = std::fs::read_to_string(&file)?;
 
@@ -725,32 +718,16 @@ fn yaml_test_impl(file: &str) -> Result<()> {
 }
 
 fn yaml_test(file: &str) -> Result<()> {
-    match yaml_test_impl(file) {
-        Ok(_) => Ok(()),
-        Err(e) => {
-            // If Err is returned, it doesn't always get printed by cargo test.
-            // Therefore, panic with the error.
-            panic!("{}", e);
-        }
-    }
+    check_yaml_test(file, yaml_test_impl)
 }
 
 #[test]
 #[ignore = "intended for use by scripts/yaml-test-parse"]
 fn one_yaml() -> Result<()> {
-    let mut file = String::default();
-    for a in env::args() {
-        if a.ends_with(".yaml") {
-            file = a;
-            break;
-        }
+    match file_arg(".yaml") {
+        Some(file) => yaml_test(file.as_str()),
+        None => bail!("missing <policy.rego>"),
     }
-
-    if file.is_empty() {
-        bail!("missing <policy.rego>");
-    }
-
-    yaml_test(file.as_str())
 }
 
 /*